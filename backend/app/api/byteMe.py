@@ -16,12 +16,12 @@ from app.schemas import (
     ProviderEnum,
     NetworkRequestData,
     ByteMeQueryParams,
-    WebWunderRequestHeaders,
     BaseProvider,
+    XML_BASE_HEADERS,
 )
-from pydantic import PrivateAttr
 from app.config import get_settings
-from app.utils.connection_mapper import ConnectionTypeMapper
+from app.utils.connection_mapper import map_connection_type
+from app.utils._fast_parse import normalize_row
 from app.utils.discount_calculator import DiscountCalculator, DiscountResult
 
 
@@ -31,17 +31,14 @@ class ByteMe(BaseProvider):
     Handles fetching and processing of internet service offers from the ByteMe provider.
     """
 
-    name: str = ProviderEnum.BYTEME.value
-    _logger: logging.Logger = PrivateAttr()
-    _discount_calculator: DiscountCalculator = (
-        PrivateAttr()
-    )  # Placeholder for discount calculator
+    name = ProviderEnum.BYTEME.value
+    _logger: logging.Logger
+    _discount_calculator: DiscountCalculator
     REQUEST_TIMEOUT: int = 10  # Request timeout in seconds
     PROMOTION_LENGTH: int = 24  # Length of promotion in months
     BASE_URL: str = 'https://byteme.gendev7.check24.fun/app/api/products/data'
 
-    def __init__(self, logger: logging.Logger, **data):
-        super().__init__(**data)
+    def __init__(self, logger: logging.Logger):
         self._logger = logger
         self._discount_calculator = DiscountCalculator(
             promotion_length=self.PROMOTION_LENGTH
@@ -65,9 +62,7 @@ class ByteMe(BaseProvider):
 
         # Prepare session and request parameters
         settings = get_settings()
-        headers = WebWunderRequestHeaders(
-            content_type="text/xml; charset=utf-8", x_api_key=settings.BYTEME_API_KEY
-        ).model_dump(by_alias=True)
+        headers = {**XML_BASE_HEADERS, "X-Api-Key": settings.BYTEME_API_KEY}
 
         address = request_data.address
         query_params = ByteMeQueryParams(
@@ -88,10 +83,11 @@ class ByteMe(BaseProvider):
                 self._logger.warning(f"No available products at the given address.")
                 return []
             self._logger.info(f"Found {len(products)} products")
-        # Process and normalize results
+        # Process and normalize results, sharing one timestamp per batch
+        fetched_at = datetime.now().isoformat(timespec="seconds")
         processed_results = []
         for product in products:
-            processed_results.append(self.normalize_offer(product))
+            processed_results.append(self.normalize_offer(product, fetched_at))
 
         self._logger.info(f"Successfully fetched {len(processed_results)} offers")
         return processed_results
@@ -193,8 +189,12 @@ class ByteMe(BaseProvider):
             # Remove any duplicates
             raw_products = self._remove_duplicates_from_dict_list(raw_products)
 
-            # Convert to ByteMeProduct objects
-            return [ByteMeProduct(**product) for product in raw_products]
+            # Convert to ByteMeProduct objects; normalize_row already does the
+            # type conversion, so validation is skipped
+            return [
+                ByteMeProduct.model_construct(**normalize_row(product))
+                for product in raw_products
+            ]
         except Exception as e:
             self._logger.error(
                 f"Error parsing CSV data: {e}. Data length: {len(csv_data)}...",
@@ -229,7 +229,7 @@ class ByteMe(BaseProvider):
                 base_monthly_cost, discount_in_cent=raw_offer.voucher_value
             )
 
-        return PriceDetails(
+        return PriceDetails.compute(
             monthly_cost=base_monthly_cost,
             monthly_cost_with_discount=discount_result.monthly_cost_with_discount,
             monthly_savings=discount_result.monthly_discount,
@@ -238,12 +238,15 @@ class ByteMe(BaseProvider):
             discount_percentage=discount_result.discount_percentage,
         )
 
-    def normalize_offer(self, raw_offer: ByteMeProduct) -> NormalizedOffer:
+    def normalize_offer(
+        self, raw_offer: ByteMeProduct, fetched_at: str | None = None
+    ) -> NormalizedOffer:
         """
         Normalize the provider-specific offer format into a common format.
 
         Args:
             offer: The ByteMeProduct object
+            fetched_at: ISO timestamp shared by the whole batch; defaults to now
 
         Returns:
             A normalized offer dictionary
@@ -255,14 +258,14 @@ class ByteMe(BaseProvider):
             offer_id=raw_offer.product_id,
             name=raw_offer.provider_name,
             speed=raw_offer.speed,
-            connection_type=ConnectionTypeMapper.map_connection_type(
+            connection_type=map_connection_type(
                 raw_offer.connection_type
             ),
             installation_service=raw_offer.installation_service,
             contract_duration=raw_offer.duration_in_months,
             promotion_length=self.PROMOTION_LENGTH,
-            tv_service=raw_offer.tv,
+            tv_service=raw_offer.tv or None,  # CSV yields empty strings
             data_limit=raw_offer.limit_from,
-            fetched_at=datetime.now().isoformat(timespec="seconds"),
+            fetched_at=fetched_at or datetime.now().isoformat(timespec="seconds"),
             price_details=price_details,
         )
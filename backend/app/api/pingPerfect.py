@@ -1,16 +1,15 @@
 from datetime import datetime
-from pydantic import PrivateAttr
 from app.schemas import (
     NormalizedOffer,
     PingPerfectProduct,
     PingPerfectRequestData,
-    PingPerfectHeaders,
     PriceDetails,
     ProviderEnum,
     NetworkRequestData,
     BaseProvider,
 )
-from app.utils.connection_mapper import ConnectionTypeMapper
+from app.utils.connection_mapper import map_connection_type
+from app.validators import PING_PERFECT_PRODUCT_LIST_ADAPTER
 from app.config import get_settings
 from typing import Any
 import aiohttp
@@ -21,19 +20,21 @@ import hmac
 import hashlib
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+# Static part of the request headers; the signature headers vary per request
+_BASE_HEADERS: dict[str, str] = {"Content-Type": "application/json"}
+
 
 class PingPerfect(BaseProvider):
     """
     PingPerfect provider implementation.
     Handles fetching and processing of internet service offers from the PingPerfect provider.
     """
-    name: str = ProviderEnum.PINGPERFECT.value
-    _logger: logging.Logger = PrivateAttr()
+    name = ProviderEnum.PINGPERFECT.value
+    _logger: logging.Logger
     REQUEST_TIMEOUT: int = 10  # Request timeout in seconds
     BASE_URL: str = 'https://pingperfect.gendev7.check24.fun/internet/angebote/data'
     
-    def __init__(self, logger: logging.Logger, **data):
-        super().__init__(**data)
+    def __init__(self, logger: logging.Logger):
         self._logger = logger
         
     async def get_offers(
@@ -69,7 +70,7 @@ class PingPerfect(BaseProvider):
             payload_hashed=payload_hashed,
             client_id=settings.PINGPERFECT_CLIENT_ID,
             current_timestamp=current_timestamp,
-        ).model_dump(by_alias=True)
+        )
 
         async with aiohttp.ClientSession(headers=headers) as session:
             # Get all products in a single request
@@ -84,10 +85,11 @@ class PingPerfect(BaseProvider):
             
             self._logger.info(f"Found products")
         
-        # Process and normalize results
+        # Process and normalize results, sharing one timestamp per batch
+        fetched_at = datetime.now().isoformat(timespec="seconds")
         processed_results = []
         for product in response_data:
-            processed_results.append(self.normalize_offer(product))
+            processed_results.append(self.normalize_offer(product, fetched_at))
             
         self._logger.info(f"Successfully fetched {len(processed_results)} offers")
         return processed_results    
@@ -128,10 +130,10 @@ class PingPerfect(BaseProvider):
                     self._logger.error(f"Failed to fetch offers: {response.status}")
                     response.raise_for_status()
                 
-                response_data = await response.json()
-                self._logger.debug(f"Raw response data: {response_data}")
+                raw_response = await response.read()
+                self._logger.debug(f"Raw response data: {raw_response.decode(errors='replace')}")
 
-                return [PingPerfectProduct(**data) for data in response_data]
+                return PING_PERFECT_PRODUCT_LIST_ADAPTER.validate_json(raw_response)
 
         except aiohttp.ClientResponseError as e:
             # Attempt to get response text for better error logging
@@ -163,19 +165,22 @@ class PingPerfect(BaseProvider):
             )
             return {}
             
-    def normalize_offer(self, raw_offer: PingPerfectProduct) -> NormalizedOffer:
+    def normalize_offer(
+        self, raw_offer: PingPerfectProduct, fetched_at: str | None = None
+    ) -> NormalizedOffer:
         """
         Normalize the provider-specific offer format into a common format.
         
         Args:
             product: The product data dictionary
+            fetched_at: ISO timestamp shared by the whole batch; defaults to now
             
         Returns:
             A normalized offer dictionary
         """
         self._logger.debug(f"Normalizing raw offer: {raw_offer}")
 
-        price_details = PriceDetails(
+        price_details = PriceDetails.compute(
             monthly_cost=raw_offer.pricing_details.monthly_cost_in_cent,
         )
 
@@ -184,14 +189,14 @@ class PingPerfect(BaseProvider):
             offer_id=self._generate_offer_id(raw_offer.provider_name),
             name=raw_offer.provider_name,
             speed=raw_offer.product_info.speed,
-            connection_type=ConnectionTypeMapper.map_connection_type(raw_offer.product_info.connection_type),
+            connection_type=map_connection_type(raw_offer.product_info.connection_type),
             price_details=price_details,
             contract_duration=raw_offer.product_info.contract_duration_in_months,
             installation_service=raw_offer.pricing_details.installation_service,
-            tv_service=raw_offer.product_info.tv,
+            tv_service=raw_offer.product_info.tv or None,
             max_age=raw_offer.product_info.max_age,
             data_limit=raw_offer.product_info.limit_from,
-            fetched_at=datetime.now().isoformat(timespec="seconds"),
+            fetched_at=fetched_at or datetime.now().isoformat(timespec="seconds"),
         )
         
         return normalized_offer
@@ -221,7 +226,7 @@ class PingPerfect(BaseProvider):
         
     def _get_headers(
         self, payload_hashed: str, client_id: str, current_timestamp: int
-    ) -> PingPerfectHeaders:
+    ) -> dict[str, str]:
         """
         Create the headers for the API request.
         
@@ -231,16 +236,14 @@ class PingPerfect(BaseProvider):
             current_timestamp: The current timestamp
             
         Returns:
-            A PingPerfectHeaders object
+            A headers dictionary with the signature headers
         """
-        headers = PingPerfectHeaders(
-            x_client_id=client_id,
-            x_signature=payload_hashed,
-            x_timestamp=str(current_timestamp),
-            content_type="application/json",
-        )
-
-        return headers
+        return {
+            **_BASE_HEADERS,
+            "X-Client-Id": client_id,
+            "X-Signature": payload_hashed,
+            "X-Timestamp": str(current_timestamp),
+        }
         
     def _get_hashed_payload(
         self, payload_as_json: str, current_timestamp: int, secret: str
@@ -3,7 +3,6 @@ import aiohttp
 import asyncio
 import logging
 from typing import Dict, List, Any, Union
-from pydantic import PrivateAttr
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -19,13 +18,17 @@ from app.schemas import (
     NetworkRequestData,
     ServusSpeedAvailableProducts,
     ServusSpeedHeaders,
-    ServusSpeedRequestData,
-    ServusSpeedRequestAddress,
     ServusSpeedProduct,
     BaseProvider,
 )
 from app.utils.discount_calculator import DiscountCalculator
-from app.utils.connection_mapper import ConnectionTypeMapper
+from app.validators import (
+    SERVUS_SPEED_AVAILABLE_PRODUCTS_ADAPTER,
+    SERVUS_SPEED_PRODUCT_RESPONSE_ADAPTER,
+)
+
+# Static request headers, built once at import instead of per request
+_HEADERS: Dict[str, str] = ServusSpeedHeaders().model_dump(by_alias=True)
 
 
 class ServusSpeed(BaseProvider):
@@ -34,8 +37,8 @@ class ServusSpeed(BaseProvider):
     Handles fetching and processing of internet service offers from the ServusSpeed provider.
     """
 
-    name: str = ProviderEnum.SERVUSSPEED.value
-    _logger: logging.Logger = PrivateAttr()
+    name = ProviderEnum.SERVUSSPEED.value
+    _logger: logging.Logger
     BASE_URL: str = 'https://servus-speed.gendev7.check24.fun'
     PRODUCTS_ENDPOINT: str = 'api/external/available-products'
     GET_PRODUCT_ENDPOINT: str = 'api/external/product-details'
@@ -47,8 +50,7 @@ class ServusSpeed(BaseProvider):
         0.1  # Small delay between requests to avoid overwhelming the API
     )
 
-    def __init__(self, logger: logging.Logger, **data):
-        super().__init__(**data)
+    def __init__(self, logger: logging.Logger):
         self._logger = logger
 
     async def get_offers(
@@ -73,7 +75,7 @@ class ServusSpeed(BaseProvider):
 
         async with aiohttp.ClientSession(
             base_url=self.BASE_URL,
-            headers=ServusSpeedHeaders().model_dump(by_alias=True),
+            headers=_HEADERS,
             auth=basic_auth,
         ) as session:
             # Get available products first
@@ -104,6 +106,7 @@ class ServusSpeed(BaseProvider):
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results, filtering out exceptions
+        fetched_at = datetime.now().isoformat(timespec="seconds")
         processed_results = []
         for i, result in enumerate(results):
             if isinstance(result, Exception):
@@ -112,29 +115,33 @@ class ServusSpeed(BaseProvider):
                     f"Error fetching product {product_id}: {result}", exc_info=result
                 )
             elif result:  # Filter out empty results
-                processed_results.append(self.normalize_offer(result))
+                processed_results.append(self.normalize_offer(result, fetched_at))
 
         self._logger.info(f"Successfully fetched {len(processed_results)} offers")
         return processed_results
 
-    def _get_payload(self, request_data: NetworkRequestData) -> ServusSpeedRequestData:
+    def _get_payload(self, request_data: NetworkRequestData) -> Dict[str, Any]:
         """
         Create the payload for the request to the provider.
+        The validated address is remapped to the provider's German field
+        names directly, without building an intermediate model.
 
         Args:
             request_data: The network request data containing address information
 
         Returns:
-            A ServusSpeedRequestData object
+            The JSON payload as a dictionary
         """
-        address = ServusSpeedRequestAddress(
-            street=request_data.address.street,
-            house_number=request_data.address.house_number,
-            zip=request_data.address.zip,
-            city=request_data.address.city,
-            country_code=request_data.address.country_code,
-        )
-        return ServusSpeedRequestData(address=address)
+        address = request_data.address
+        return {
+            "address": {
+                "strasse": address.street,
+                "hausnummer": address.house_number,
+                "postleitzahl": address.zip,
+                "stadt": address.city,
+                "land": address.country_code,
+            }
+        }
 
     def _get_basic_auth(self) -> aiohttp.BasicAuth:
         """Get the basic auth helper for the provider.
@@ -156,7 +163,7 @@ class ServusSpeed(BaseProvider):
     async def _get_offer(
         self,
         session: aiohttp.ClientSession,
-        payload: ServusSpeedRequestData,
+        payload: Dict[str, Any],
         product_id: str,
     ) -> ServusSpeedProduct | Dict[str, Any]:
         """
@@ -172,13 +179,11 @@ class ServusSpeed(BaseProvider):
             A ServusSpeedProduct object or an empty dict on failure
         """
         await asyncio.sleep(self.REQUEST_DELAY)  # Small delay between requests
-        payload_dict = payload.model_dump(by_alias=True)
-        raw_response_json = {}
 
         try:
             async with session.post(
                 f"{self.GET_PRODUCT_ENDPOINT}/{product_id}",
-                json=payload_dict,
+                json=payload,
                 timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
             ) as response:
                 self._logger.debug(
@@ -198,12 +203,12 @@ class ServusSpeed(BaseProvider):
                     )
                     return {}
 
-                raw_response_json = await response.json()
+                raw_response = await response.read()
                 self._logger.debug(
-                    f"Offer for product {product_id} - Raw response: {raw_response_json}"
+                    f"Offer for product {product_id} - Raw response: {raw_response.decode(errors='replace')}"
                 )
 
-                return self._map_json_to_product(raw_response_json)
+                return self._map_json_to_product(raw_response)
 
         except aiohttp.ClientResponseError as e:
             # Attempt to get response text for better error logging
@@ -243,7 +248,7 @@ class ServusSpeed(BaseProvider):
     async def _get_available_products(
         self,
         session: aiohttp.ClientSession,
-        payload: ServusSpeedRequestData,
+        payload: Dict[str, Any],
     ) -> ServusSpeedAvailableProducts:
         """
         Get a list of available products from the provider.
@@ -256,12 +261,11 @@ class ServusSpeed(BaseProvider):
         Returns:
             A ServusSpeedAvailableProducts object containing product IDs
         """
-        payload_dict = payload.model_dump(by_alias=True)
 
         try:
             async with session.post(
                 f"{self.PRODUCTS_ENDPOINT}",
-                json=payload_dict,
+                json=payload,
                 timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT),
             ) as response:
                 response.raise_for_status()  # Will trigger retry via tenacity decorator
@@ -272,11 +276,11 @@ class ServusSpeed(BaseProvider):
                     )
                     return ServusSpeedAvailableProducts(available_products=[])
 
-                raw_response = await response.json()
-                self._logger.debug(f"Available products response: {raw_response}")
+                raw_response = await response.read()
+                self._logger.debug(f"Available products response: {raw_response.decode(errors='replace')}")
 
-                return ServusSpeedAvailableProducts(
-                    available_products=raw_response.get("availableProducts", [])
+                return SERVUS_SPEED_AVAILABLE_PRODUCTS_ADAPTER.validate_json(
+                    raw_response
                 )
 
         except aiohttp.ClientResponseError as e:
@@ -290,14 +294,13 @@ class ServusSpeed(BaseProvider):
             self._logger.exception(f"Error fetching available products: {str(e)}")
             return ServusSpeedAvailableProducts(available_products=[])
 
-    def _map_json_to_product(
-        self, raw_response_json: Dict[str, Any]
-    ) -> ServusSpeedProduct:
+    def _map_json_to_product(self, raw_response: bytes) -> ServusSpeedProduct:
         """
         Map the raw JSON response from the API to a ServusSpeedProduct object.
+        The bytes are validated directly, without decoding into a dict first.
 
         Args:
-            raw_response_json: The raw JSON response from the API
+            raw_response: The raw JSON response body from the API
 
         Returns:
             A ServusSpeedProduct object
@@ -305,28 +308,25 @@ class ServusSpeed(BaseProvider):
         Raises:
             ValueError: If the JSON structure is invalid or missing required fields
         """
-        product_data = raw_response_json.get("servusSpeedProduct")
-        if not product_data:
-            error_msg = (
-                "Failed to parse: 'servusSpeedProduct' key missing or data is empty"
-            )
-            self._logger.error(f"{error_msg}: {raw_response_json}")
-            raise ValueError(f"{error_msg}")
-
         try:
-            return ServusSpeedProduct(**product_data)
+            return SERVUS_SPEED_PRODUCT_RESPONSE_ADAPTER.validate_json(
+                raw_response
+            ).servus_speed_product
         except Exception as e:
             self._logger.error(
-                f"Error parsing: {e}. Data: {product_data}", exc_info=True
+                f"Error parsing: {e}. Data: {raw_response.decode(errors='replace')}", exc_info=True
             )
             raise ValueError(f"Error parsing: {e}")
 
-    def normalize_offer(self, raw_offer: ServusSpeedProduct) -> NormalizedOffer:
+    def normalize_offer(
+        self, raw_offer: ServusSpeedProduct, fetched_at: str | None = None
+    ) -> NormalizedOffer:
         """
         Normalize the provider-specific offer format into a common format.
 
         Args:
             offer: The raw offer data from the provider
+            fetched_at: ISO timestamp shared by the whole batch; defaults to now
 
         Returns:
             A normalized offer dictionary
@@ -341,7 +341,7 @@ class ServusSpeed(BaseProvider):
             discount_in_cent=raw_offer.discount,
         )
 
-        price_details = PriceDetails(
+        price_details = PriceDetails.compute(
             monthly_cost=raw_offer.pricing_details.monthly_cost_in_cent,
             monthly_cost_with_discount=discount_result.monthly_cost_with_discount,
             monthly_savings=discount_result.monthly_discount,
@@ -349,24 +349,20 @@ class ServusSpeed(BaseProvider):
             discount_percentage=discount_result.discount_percentage,
         )
 
-        connection_type = ConnectionTypeMapper.map_connection_type(
-            raw_offer.product_info.connection_type
-        )
-
         return NormalizedOffer(
             provider=self.name,
             offer_id=self._generate_offer_id(raw_offer.provider_name),
             name=raw_offer.provider_name,
             speed=raw_offer.product_info.speed,
-            connection_type=connection_type,
+            connection_type=raw_offer.product_info.connection_type,
             price_details=price_details,
             contract_duration=raw_offer.product_info.contract_duration_in_months,
             installation_service=raw_offer.pricing_details.installation_service,
             max_age=raw_offer.product_info.max_age,
-            tv_service=raw_offer.product_info.tv,
+            tv_service=raw_offer.product_info.tv or None,
             promotion_length=raw_offer.product_info.contract_duration_in_months,
             data_limit=raw_offer.product_info.limit_from,
-            fetched_at=datetime.now().isoformat(timespec="seconds"),
+            fetched_at=fetched_at or datetime.now().isoformat(timespec="seconds"),
         )
 
     def _generate_offer_id(self, product_name: str) -> str:
@@ -3,8 +3,8 @@ import asyncio
 import logging
 import re
 from datetime import datetime
-from typing import Any
-from pydantic import PrivateAttr
+from functools import lru_cache
+from typing import Any, Final, Iterable
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -13,6 +13,7 @@ from tenacity import (
 )
 
 from app.schemas import (
+    ConnectionTypeEnum,
     PriceDetails,
     ProviderEnum,
     NetworkRequestData,
@@ -23,8 +24,151 @@ from app.schemas import (
     NormalizedOffer,
 )
 from app.config import get_settings
-from app.utils.connection_mapper import ConnectionTypeMapper
 from app.utils.discount_calculator import DiscountCalculator, DiscountResult
+from app.validators import VERBYNDICH_PRODUCT_ADAPTER
+
+# The offer paragraph has a rigid shape ("Für nur 30€ im Monat erhalten Sie
+# eine DSL-Verbindung mit einer Geschwindigkeit von 25 Mbit/s"), so its
+# numbers and connection type are found with plain string searches
+_CONNECTION_KEYWORDS: Final[tuple[tuple[str, ConnectionTypeEnum], ...]] = (
+    ("DSL-Verbindung", ConnectionTypeEnum.DSL),
+    ("Cable-Verbindung", ConnectionTypeEnum.CABLE),
+    ("Fiber-Verbindung", ConnectionTypeEnum.FIBER),
+    ("Mobile-Verbindung", ConnectionTypeEnum.MOBILE),
+)
+# "Fernsehsender enthalten RobynTV+"
+_RE_TV: Final[re.Pattern[str]] = re.compile(r"Fernsehsender enthalten ([^.]+)")
+
+# Fields of the contract terms paragraph, fused into a single alternation so
+# the text is scanned once. The outer group names the field
+# (match.lastgroup), the inner groups capture its values.
+_RE_TAIL_FIELDS: Final[re.Pattern[str]] = re.compile(
+    # "Mindestvertragslaufzeit 12 Monate"
+    r"(?P<duration>Mindestvertragslaufzeit (?P<duration_value>\d+) Monate)"
+    # "Ab dem 24. Monat beträgt der monatliche Preis 29€"
+    r"|(?P<price_after>Ab dem \d+\. Monat beträgt der monatliche Preis "
+    r"(?P<price_after_value>\d+)€)"
+    # "Ab 250GB pro Monat wird die Geschwindigkeit gedrosselt"
+    r"|(?P<throttle>Ab (?P<throttle_value>\d+)GB pro Monat wird die "
+    r"Geschwindigkeit gedrosselt)"
+    # "nur für Personen unter 27 Jahren"
+    r"|(?P<age_limit>nur für Personen unter (?P<age_limit_value>\d+) Jahren)"
+    # "einmaligen Rabatt von 107€ auf Ihre monatliche Rechnung"
+    r"|(?P<discount_abs>einmaligen Rabatt von (?P<discount_abs_value>\d+)€ "
+    r"auf Ihre monatliche Rechnung)"
+    # "Rabatt von 12% auf Ihre monatliche Rechnung bis zum 24. Monat"
+    r"|(?P<discount_pct>Rabatt von (?P<discount_pct_value>\d+)% auf Ihre "
+    r"monatliche Rechnung bis zum \d+\. Monat)"
+    # "Der maximale Rabatt beträgt 107€"
+    r"|(?P<discount_max>Der maximale Rabatt beträgt (?P<discount_max_value>\d+)€)"
+    # "Der Mindestbestellwert beträgt 7€"
+    r"|(?P<min_order>Der Mindestbestellwert beträgt (?P<min_order_value>\d+)€)"
+)
+
+
+def _scan_int_between(
+    text: str, prefix: str, suffix: str, start: int = 0
+) -> int | None:
+    """
+    Find the integer between the first prefix and the following suffix.
+
+    Args:
+        text: Text to search in
+        prefix: Literal text directly before the number
+        suffix: Literal text directly after the number
+        start: Index to start searching from
+
+    Returns:
+        The integer, or None if prefix or suffix is not found
+    """
+    i = text.find(prefix, start)
+    if i < 0:
+        return None
+    i += len(prefix)
+    j = text.find(suffix, i)
+    return int(text[i:j]) if j > i else None
+
+
+@lru_cache(maxsize=4096)
+def _parse_description(description: str) -> VerbynDichProduct:
+    """
+    Parse the German description text to extract offer details.
+    Descriptions usually hold an offer paragraph and, after a blank line, a
+    contract terms paragraph. The fixed-shape offer fields are read with
+    plain string searches, the contract terms are scanned once with a fused
+    regex. Without a blank line the whole text is scanned for both.
+    Descriptions are templated and repeat across pages and requests, so
+    results are memoized; the returned product is frozen and safe to share.
+
+    Args:
+        description: German description text from VerbynDich
+
+    Returns:
+        The parsed offer details
+
+    Raises:
+        ValueError: If a required field is missing from the description
+    """
+    head, separator, tail = description.partition("\n\n")
+    if not separator:
+        tail = description
+    parsed = {}
+
+    # Offer paragraph: "Für nur 30€ ... DSL-Verbindung ... 25 Mbit/s"
+    monthly_cost = _scan_int_between(head, "Für nur ", "€")
+    speed = _scan_int_between(head, "Geschwindigkeit von ", " Mbit/s")
+    connection_type = next(
+        (name for keyword, name in _CONNECTION_KEYWORDS if keyword in head),
+        None,
+    )
+    if monthly_cost is None or speed is None or connection_type is None:
+        raise ValueError(
+            "Missing monthly cost, connection type or speed in description"
+        )
+    parsed["monthly_cost_in_cent"] = monthly_cost * 100  # Convert to cents
+    parsed["connection_type"] = connection_type
+    parsed["speed"] = speed
+
+    if "Fernsehsender" in description:
+        tv_match = _RE_TV.search(description)
+        if tv_match:
+            parsed["tv"] = tv_match.group(1).strip()
+
+    # Contract terms paragraph
+    for match in _RE_TAIL_FIELDS.finditer(tail):
+        field = match.lastgroup
+        if field == "duration":
+            parsed["contract_duration"] = int(match.group("duration_value"))
+        elif field == "price_after":
+            parsed["price_after_promotion"] = (
+                int(match.group("price_after_value")) * 100
+            )
+        elif field == "throttle":
+            parsed["data_limit"] = int(match.group("throttle_value"))
+        elif field == "age_limit":
+            parsed["age_restriction"] = int(match.group("age_limit_value"))
+        elif field == "discount_abs":
+            parsed["absolute_discount_in_cent"] = (
+                int(match.group("discount_abs_value")) * 100
+            )
+        elif field == "discount_pct":
+            parsed["discount_percentage"] = int(match.group("discount_pct_value"))
+        elif field == "discount_max":
+            parsed["max_discount"] = int(match.group("discount_max_value")) * 100
+        elif field == "min_order":
+            parsed["min_order_value_in_cent"] = (
+                int(match.group("min_order_value")) * 100
+            )
+
+    if "contract_duration" not in parsed:
+        raise ValueError(
+            "Missing contract duration in description"
+        )
+
+    # Without a later price the monthly cost stays the same
+    parsed.setdefault("price_after_promotion", parsed["monthly_cost_in_cent"])
+
+    return VERBYNDICH_PRODUCT_ADAPTER.validate_python(parsed)
 
 
 class VerbynDich(BaseProvider):
@@ -33,11 +177,9 @@ class VerbynDich(BaseProvider):
     Handles fetching and processing of internet service offers from the VerbynDich provider.
     """
 
-    name: str = ProviderEnum.VERBYNDICH.value
-    _logger: logging.Logger = PrivateAttr()
-    _discount_calculator: DiscountCalculator = (
-        PrivateAttr()
-    )  # Placeholder for discount calculator
+    name = ProviderEnum.VERBYNDICH.value
+    _logger: logging.Logger
+    _discount_calculator: DiscountCalculator
     BASE_URL: str = 'https://verbyndich.gendev7.check24.fun/check24/data'
     MAX_PAGE: int = 17
     REQUEST_TIMEOUT: int = 10  # Request timeout in seconds
@@ -49,8 +191,7 @@ class VerbynDich(BaseProvider):
     )
     PROMOTION_LENGTH: int = 24  # Length of promotion in months
 
-    def __init__(self, logger: logging.Logger, **data):
-        super().__init__(**data)
+    def __init__(self, logger: logging.Logger):
         self._logger = logger
         self._discount_calculator = DiscountCalculator(
             promotion_length=self.PROMOTION_LENGTH
@@ -90,14 +231,16 @@ class VerbynDich(BaseProvider):
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results, filter out exceptions if any
-        processed_results = []
+        raw_offers = []
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 self._logger.error(
                     f"Error fetching page {i}: {result}", exc_info=result
                 )
             elif result:  # Filter out empty results
-                processed_results.append(result)
+                raw_offers.append(result)
+
+        processed_results = self.normalize_offers(raw_offers)
 
         self._logger.info(
             f"Successfully fetched {len(processed_results)} offers"
@@ -114,7 +257,7 @@ class VerbynDich(BaseProvider):
         payload: VerbynDichRequestData,
         page: int,
         semaphore: asyncio.Semaphore,
-    ) -> NormalizedOffer:
+    ) -> dict[str, Any]:
         """
         Get an offer with rate limiting via semaphore.
 
@@ -144,7 +287,7 @@ class VerbynDich(BaseProvider):
         session: aiohttp.ClientSession,
         payload: VerbynDichRequestData,
         page: int = 0,
-    ) -> NormalizedOffer:
+    ) -> dict[str, Any]:
         """
         Get an offer from the provider for a specific page.
         Automatically retries on certain errors with exponential backoff.
@@ -194,7 +337,7 @@ class VerbynDich(BaseProvider):
                 raw_response_json = await response.json()
                 self._logger.debug(f"Page {page} - Raw response: {raw_response_json}")
 
-                return self.normalize_offer(raw_response_json)
+                return raw_response_json
 
         except aiohttp.ClientResponseError as e:
             # Attempt to get response text for better error logging
@@ -236,7 +379,7 @@ class VerbynDich(BaseProvider):
             discount_in_cent=raw_offer.absolute_discount_in_cent,
         )
 
-        return PriceDetails(
+        return PriceDetails.compute(
             monthly_cost=base_monthly_cost,
             monthly_cost_with_discount=discount_result.monthly_cost_with_discount,
             monthly_savings=discount_result.monthly_discount,
@@ -245,12 +388,37 @@ class VerbynDich(BaseProvider):
             discount_percentage=discount_result.discount_percentage,
         )
 
-    def normalize_offer(self, raw_offer: dict[str, Any]) -> NormalizedOffer:
+    def normalize_offers(
+        self, raw_offers: Iterable[dict[str, Any]]
+    ) -> list[NormalizedOffer]:
+        """
+        Normalize a batch of raw offers, sharing one fetched_at timestamp.
+        Invalid offers are skipped.
+
+        Args:
+            raw_offers: Raw offer data from VerbynDich API, one per page
+
+        Returns:
+            List of normalized offers
+        """
+        fetched_at = datetime.now().isoformat(timespec="seconds")
+        normalized_offers = []
+        for raw_offer in raw_offers:
+            offer = self.normalize_offer(raw_offer, fetched_at)
+            if offer:  # Filter out invalid offers
+                normalized_offers.append(offer)
+
+        return normalized_offers
+
+    def normalize_offer(
+        self, raw_offer: dict[str, Any], fetched_at: str | None = None
+    ) -> NormalizedOffer:
         """
         Normalize the provider-specific offer format into a common format.
 
         Args:
             raw_offer: Raw offer data from VerbynDich API
+            fetched_at: ISO timestamp shared by the whole batch; defaults to now
 
         Returns:
             Normalized offer data matching NormalizedOffer schema
@@ -270,7 +438,7 @@ class VerbynDich(BaseProvider):
                 )
 
             # Parse the description to extract offer details
-            parsed_data = self._parse_description(description)
+            parsed_data = _parse_description(description)
             price_details = self._get_price_details(parsed_data)
 
             # Create normalized offer using NormalizedOffer schema
@@ -279,136 +447,19 @@ class VerbynDich(BaseProvider):
                 offer_id=self._generate_offer_id(product_name),
                 name=product_name,
                 speed=parsed_data.speed,
-                connection_type=ConnectionTypeMapper.map_connection_type(
-                    parsed_data.connection_type
-                ),  
+                connection_type=parsed_data.connection_type,
                 contract_duration=parsed_data.contract_duration,
                 installation_service=False,
                 promotion_length=self.PROMOTION_LENGTH,
                 tv_service=parsed_data.tv,
                 data_limit=parsed_data.data_limit,
                 price_details=price_details,
-                fetched_at=datetime.now().isoformat(timespec="seconds"),
+                fetched_at=fetched_at or datetime.now().isoformat(timespec="seconds"),
             )
 
         except Exception as e:
             self._logger.error(f"Error normalizing offer: {e}", exc_info=True)
             return None
 
-    def _parse_description(self, description: str) -> VerbynDichProduct:
-        """
-        Parse the German description text to extract offer details.
-
-        Args:
-            description: German description text from VerbynDich
-
-        Returns:
-            Dictionary with parsed offer details
-        """
-        parsed = {}
-
-        # Extract monthly cost: "Für nur 30€ im Monat"
-        cost_match = re.search(r"Für nur (\d+)€ im Monat", description)
-        if cost_match:
-            parsed["monthly_cost_in_cent"] = (
-                int(cost_match.group(1)) * 100
-            )  # Convert to cents
-        else:
-            self._logger.warning("Could not extract monthly cost from description")
-            raise ValueError(
-                "Missing monthly cost in description"
-            )
-
-        # Extract connection type: "DSL-Verbindung", "Cable-Verbindung", "Fiber-Verbindung"
-        connection_match = re.search(r"(DSL|Cable|Fiber|Mobile)-Verbindung", description)
-        if connection_match:
-            parsed["connection_type"] = connection_match.group(1).upper()
-        else:
-            self._logger.warning("Could not extract connection type from description")
-            raise ValueError(
-                "Missing connection type in description"
-            )
-
-        # Extract speed: "Geschwindigkeit von 25 Mbit/s"
-        speed_match = re.search(r"Geschwindigkeit von (\d+) Mbit/s", description)
-        if speed_match:
-            parsed["speed"] = int(speed_match.group(1))
-        else:
-            self._logger.warning("Could not extract speed from description")
-            raise ValueError(
-                "Missing speed in description"
-            )
-
-        # Extract contract duration: "Mindestvertragslaufzeit 12 Monate"
-        contract_match = re.search(r"Mindestvertragslaufzeit (\d+) Monate", description)
-        if contract_match:
-            parsed["contract_duration"] = int(contract_match.group(1))
-        else:
-            self._logger.warning("Could not extract contract duration from description")
-            raise ValueError(
-                "Missing contract duration in description"
-            )
-
-        # Extract price after promotion: "Ab dem 24. Monat beträgt der monatliche Preis 29€"
-        promo_price_match = re.search(
-            r"Ab dem \d+\. Monat beträgt der monatliche Preis (\d+)€", description
-        )
-        if promo_price_match:
-            parsed["price_after_promotion"] = (
-                int(promo_price_match.group(1)) * 100
-            )
-        else:
-            parsed["price_after_promotion"] = parsed['monthly_cost_in_cent']
-
-        # Extract TV services: "Fernsehsender enthalten RobynTV+"
-        tv_match = re.search(r"Fernsehsender enthalten ([^.]+)", description)
-        if tv_match:
-            parsed["tv"] = f"{tv_match.group(1).strip()}"
-
-        # Extract data limit: "Ab 250GB pro Monat wird die Geschwindigkeit gedrosselt"
-        data_limit_match = re.search(
-            r"Ab (\d+)GB pro Monat wird die Geschwindigkeit gedrosselt", description
-        )
-        if data_limit_match:
-            parsed["data_limit"] = int(data_limit_match.group(1))
-
-        # Extract age restriction: "nur für Personen unter 27 Jahren"
-        age_match = re.search(r"nur für Personen unter (\d+) Jahren", description)
-        if age_match:
-            parsed["age_restriction"] = int(age_match.group(1))
-
-        # Extract discount information: "Rabatt von 12% auf Ihre monatliche Rechnung bis zum 24. Monat"
-        discount_match = re.search(
-            r"Rabatt von (\d+)% auf Ihre monatliche Rechnung bis zum (\d+)\. Monat",
-            description,
-        )
-        if discount_match:
-            parsed["discount_percentage"] = int(discount_match.group(1))
-
-        # Extract maximum discount: "Der maximale Rabatt beträgt 107€"
-        max_discount_match = re.search(
-            r"Der maximale Rabatt beträgt (\d+)€", description
-        )
-        if max_discount_match:
-            parsed["max_discount"] = int(max_discount_match.group(1)) * 100
-            
-        # Extract absolute discount: "einmaligen Rabatt von 107€ auf Ihre monatliche Rechnung"
-        absolute_discount_match = re.search(
-            r"einmaligen Rabatt von (\d+)€ auf Ihre monatliche Rechnung", description
-        )
-        if absolute_discount_match:
-            parsed["absolute_discount_in_cent"] = int(absolute_discount_match.group(1)) * 100
-
-
-        # Extract minimum order value: "Der Mindestbestellwert beträgt 7€."
-        min_order_value_match = re.search(
-            r"Der Mindestbestellwert beträgt (\d+)€", description
-        )
-        if min_order_value_match:
-            parsed["min_order_value_in_cent"] = int(min_order_value_match.group(1)) * 100
-        
-        return VerbynDichProduct(**parsed)
-
-
     def _generate_offer_id(self, product_name: str) -> str:
         return f"{self.name}_{product_name.replace(' ', '_').lower()}"
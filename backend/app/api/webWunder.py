@@ -1,21 +1,20 @@
 import asyncio
-from pydantic import PrivateAttr
 from app.schemas import (
     NormalizedOffer,
     PriceDetails,
     ProviderEnum,
     NetworkRequestData,
-    WebWunderRequestHeaders,
     BaseProvider,
     WebWunderProduct,
     WebWunderFetchReturn,
+    XML_BASE_HEADERS,
 )
 from app.config import get_settings
 from app.api.webwunder_config import WebWunderConfig
 from app.utils.xml_parser import WebWunderXMLParser
 
 from app.utils.discount_calculator import DiscountCalculator
-from app.utils.connection_mapper import ConnectionTypeMapper
+from app.utils.connection_mapper import map_connection_type
 from typing import List
 import aiohttp
 import logging
@@ -34,12 +33,11 @@ class WebWunder(BaseProvider):
     Handles fetching and processing of internet service offers from the WebWunder provider.
     """
 
-    name: str = ProviderEnum.WEBWUNDER.value
-    _logger: logging.Logger = PrivateAttr()
-    _discount_calculator: DiscountCalculator = PrivateAttr()
+    name = ProviderEnum.WEBWUNDER.value
+    _logger: logging.Logger
+    _discount_calculator: DiscountCalculator
 
-    def __init__(self, logger: logging.Logger, **data):
-        super().__init__(**data)
+    def __init__(self, logger: logging.Logger):
         self._logger = logger
         self._discount_calculator = DiscountCalculator(
             promotion_length=WebWunderConfig.PROMOTION_LENGTH
@@ -97,9 +95,7 @@ class WebWunder(BaseProvider):
     def _create_api_headers(self) -> dict:
         """Create API headers for requests."""
         settings = get_settings()
-        return WebWunderRequestHeaders(x_api_key=settings.WEBWUNDER_API_KEY).model_dump(
-            by_alias=True
-        )
+        return {**XML_BASE_HEADERS, "X-Api-Key": settings.WEBWUNDER_API_KEY}
 
     def _create_fetch_tasks(
         self,
@@ -187,6 +183,7 @@ class WebWunder(BaseProvider):
             List of normalized offers
         """
         normalized_offers = []
+        fetched_at = datetime.now().isoformat(timespec="seconds")
 
         for result in fetch_results:
             if not result.response_text:
@@ -197,20 +194,25 @@ class WebWunder(BaseProvider):
                 continue
 
             try:
-                raw_offers = WebWunderXMLParser.parse_response(result.response_text)
+                offers = [
+                    self.normalize_offer(
+                        raw_offer,
+                        installation_service=result.installation_service,
+                        fetched_at=fetched_at,
+                    )
+                    for raw_offer in WebWunderXMLParser.parse_response(
+                        result.response_text
+                    )
+                ]
 
-                if not raw_offers:
+                if not offers:
                     self._logger.warning(
                         f"No products found for connection_type={result.connection_type}, "
                         f"installation_service={result.installation_service}"
                     )
                     continue
 
-                for raw_offer in raw_offers:
-                    normalized_offer = self.normalize_offer(
-                        raw_offer, installation_service=result.installation_service
-                    )
-                    normalized_offers.append(normalized_offer)
+                normalized_offers.extend(offers)
 
             except Exception as e:
                 self._logger.error(
@@ -335,7 +337,10 @@ class WebWunder(BaseProvider):
         )
 
     def normalize_offer(
-        self, raw_offer: WebWunderProduct, installation_service: bool
+        self,
+        raw_offer: WebWunderProduct,
+        installation_service: bool,
+        fetched_at: str | None = None,
     ) -> NormalizedOffer:
         """
         Normalize the provider-specific offer format into a common format.
@@ -343,6 +348,7 @@ class WebWunder(BaseProvider):
         Args:
             raw_offer: Raw offer data from WebWunder
             installation_service: Whether installation service is included
+            fetched_at: ISO timestamp shared by the whole batch; defaults to now
 
         Returns:
             Normalized offer data
@@ -362,11 +368,11 @@ class WebWunder(BaseProvider):
         )
 
         # Map connection type to schema format
-        connection_type = ConnectionTypeMapper.map_connection_type(
+        connection_type = map_connection_type(
             raw_offer_dict["connection_type"]
         )
 
-        price_details = PriceDetails(
+        price_details = PriceDetails.compute(
             monthly_cost=base_monthly_cost,
             monthly_cost_with_discount=discount_result.monthly_cost_with_discount,
             monthly_savings=discount_result.monthly_discount,
@@ -387,7 +393,7 @@ class WebWunder(BaseProvider):
             installation_service=installation_service,
             contract_duration=raw_offer_dict["contract_duration_in_months"],
             promotion_length=WebWunderConfig.PROMOTION_LENGTH,
-            fetched_at=datetime.now().isoformat(timespec="seconds"),
+            fetched_at=fetched_at or datetime.now().isoformat(timespec="seconds"),
         )
 
     async def _fetch_products_with_semaphore(
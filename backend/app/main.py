@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.schemas import (
     NormalizedOffer,
     ProviderEnum,
@@ -14,7 +15,7 @@ from app.config import get_settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(debug=False)
+app = FastAPI(debug=False, default_response_class=ORJSONResponse)
 #logger_uvicorn = logging.getLogger("uvicorn.error")
 #logger_uvicorn.propagate = False
 
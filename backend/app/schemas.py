@@ -1,6 +1,6 @@
 from enum import Enum
-from typing import Any, Dict, List, Literal
-from pydantic import BaseModel, Field, field_validator, ConfigDict, model_validator
+from typing import Annotated, Any, ClassVar, Dict, List
+from pydantic import BaseModel, Field, ConfigDict
 from abc import ABC, abstractmethod
 
 
@@ -11,9 +11,6 @@ class BaseModel(BaseModel):
 
     model_config = ConfigDict(
         validate_by_name=True,
-        json_encoders={
-            str: lambda v: v if v else None,  # Handle empty strings
-        },
         from_attributes=True,
     )
 
@@ -33,7 +30,26 @@ class ConnectionTypeEnum(str, Enum):
     MOBILE = "Mobile"
 
 
+class PingPerfectConnectionTypeEnum(str, Enum):
+    """Connection types in the upper-case format used by the PingPerfect API."""
+
+    DSL = "DSL"
+    CABLE = "CABLE"
+    FIBER = "FIBER"
+    MOBILE = "MOBILE"
+
+
+# Shared address field types, reused by every address-like request model
+Street = Annotated[str, Field(examples=["Musterstraße"])]
+HouseNumber = Annotated[str, Field(examples=["5"])]
+Zip = Annotated[int, Field(examples=[80333], ge=10000, le=99999)]
+City = Annotated[str, Field(examples=["München"])]
+CountryCode = Annotated[str, Field(examples=["DE"])]
+
+
 class PriceDetails(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     monthly_cost: int
     monthly_cost_with_discount: int | None = None
     monthly_savings: int | None = None
@@ -42,32 +58,54 @@ class PriceDetails(BaseModel):
     setup_fee: int | None = None
     discount_percentage: int | None = None  # Percentage discount
 
-    @model_validator(mode="after")
-    def fill_missing_fields(self):
-        # check if no discount fields are set
+    @classmethod
+    def compute(
+        cls,
+        monthly_cost: int,
+        monthly_cost_with_discount: int | None = None,
+        monthly_savings: int | None = None,
+        monthly_cost_after_promotion: int | None = None,
+        total_savings: int | None = None,
+        setup_fee: int | None = None,
+        discount_percentage: int | None = None,
+    ) -> "PriceDetails":
+        """
+        Create price details from provider data, filling in the discount
+        fields when only a higher price after the promotion is known.
+
+        The inputs come from already validated provider models, so the
+        instance is built without running validation again.
+        """
         if (
-            self.monthly_cost_with_discount is None
-            and self.monthly_savings is None
-            and self.total_savings is None
-            and self.discount_percentage is None
+            monthly_cost_after_promotion is not None
+            and monthly_cost_with_discount is None
+            and monthly_savings is None
+            and total_savings is None
+            and discount_percentage is None
+            and monthly_cost < monthly_cost_after_promotion
         ):
-            if (
-                self.monthly_cost_after_promotion is not None
-                and self.monthly_cost < self.monthly_cost_after_promotion
-            ):
-                # If monthly cost after promotion is set, calculate savings
-                self.monthly_savings = self.monthly_cost_after_promotion - self.monthly_cost
-                self.monthly_cost_with_discount = self.monthly_cost
-                self.monthly_cost = self.monthly_cost_after_promotion
-                self.discount_percentage = (
-                    int(self.monthly_savings / self.monthly_cost * 100)
-                ) if self.monthly_cost > 0 else 0
-                
-        return self
-            
+            # If monthly cost after promotion is set, calculate savings
+            monthly_savings = monthly_cost_after_promotion - monthly_cost
+            monthly_cost_with_discount = monthly_cost
+            monthly_cost = monthly_cost_after_promotion
+            discount_percentage = (
+                int(monthly_savings / monthly_cost * 100)
+            ) if monthly_cost > 0 else 0
+
+        return cls.model_construct(
+            monthly_cost=monthly_cost,
+            monthly_cost_with_discount=monthly_cost_with_discount,
+            monthly_savings=monthly_savings,
+            monthly_cost_after_promotion=monthly_cost_after_promotion,
+            total_savings=total_savings,
+            setup_fee=setup_fee,
+            discount_percentage=discount_percentage,
+        )
 
 
 class NormalizedOffer(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     # Core Identification
     provider: ProviderEnum
     offer_id: str  # self generate if not available
@@ -96,43 +134,22 @@ class NormalizedOffer(BaseModel):
     # Metadata
     fetched_at: str  # ISO timestamp
 
-    @field_validator("provider")
-    @classmethod
-    def validate_provider(cls, v):
-        if isinstance(v, str):
-            # Convert string to enum if needed
-            return ProviderEnum(v)
-        return v
-
-    @field_validator("connection_type")
-    @classmethod
-    def validate_connection_type(cls, v):
-        if isinstance(v, str):
-            return ConnectionTypeEnum(v)
-        return v
-
 
 class Address(BaseModel):
-    street: str = Field(..., examples=["Musterstraße"])
-    house_number: str = Field(..., examples=["5"])
-    zip: int = Field(..., examples=["80333"], ge=10000, le=99999)
-    city: str = Field(..., examples=["München"])
-    country_code: str = Field(..., examples=["DE"])
-
-    @field_validator("zip")
-    def validate_zip(cls, value):
-        if len(str(value)) != 5:
-            raise ValueError("ZIP code must be exactly 5 digits")
-        return value
+    street: Street
+    house_number: HouseNumber
+    zip: Zip
+    city: City
+    country_code: CountryCode
 
 
 class NetworkRequestData(BaseModel):
     address: Address
 
 
-class WebWunderRequestHeaders(BaseModel):
-    content_type: str = Field("text/xml; charset=utf-8", alias="Content-Type")
-    x_api_key: str = Field(..., alias="X-Api-Key")
+# Static part of the WebWunder and ByteMe request headers; only the
+# X-Api-Key header is added per request
+XML_BASE_HEADERS: Dict[str, str] = {"Content-Type": "text/xml; charset=utf-8"}
 
 
 class WebWunderFetchReturn(BaseModel):
@@ -162,67 +179,41 @@ class WebWunderProduct(BaseModel):
 
 
 class ByteMeQueryParams(BaseModel):
-    street: str = Field(..., examples=["Musterstraße"])
-    house_number: str = Field(..., examples=["5"], alias="houseNumber")
-    city: str = Field(..., examples=["München"])
-    plz: int = Field(..., examples=[80333])
+    street: Street
+    house_number: HouseNumber = Field(..., alias="houseNumber")
+    city: City
+    plz: Zip
 
 
 class ByteMeProduct(BaseModel):
+    # Raw CSV rows are converted by app.utils._fast_parse.normalize_row
     product_id: str = Field(..., alias="productId")
     provider_name: str = Field(..., alias="providerName")
     speed: int = Field(..., alias="speed")
-    monthly_cost_in_cent: str = Field(..., alias="monthlyCostInCent")
-    after_two_years_monthly_cost: str = Field(..., alias="afterTwoYearsMonthlyCost")
-    duration_in_months: str = Field(..., alias="durationInMonths")
+    monthly_cost_in_cent: int = Field(..., alias="monthlyCostInCent")
+    after_two_years_monthly_cost: int = Field(..., alias="afterTwoYearsMonthlyCost")
+    duration_in_months: int = Field(..., alias="durationInMonths")
     connection_type: str = Field(..., alias="connectionType")
-    installation_service: str = Field(..., alias="installationService")
+    installation_service: bool = Field(..., alias="installationService")
     tv: str = Field(..., alias="tv")
-    limit_from: str = Field(..., alias="limitFrom")
-    max_age: str = Field(..., alias="maxAge")
+    limit_from: int = Field(..., alias="limitFrom")
+    max_age: int = Field(..., alias="maxAge")
     voucher_type: str = Field(..., alias="voucherType")
-    voucher_value: str = Field(..., alias="voucherValue")
-
-    # Convert string fields to int
-    @field_validator(
-        "speed",
-        "monthly_cost_in_cent",
-        "after_two_years_monthly_cost",
-        "duration_in_months",
-        "limit_from",
-        "max_age",
-        "voucher_value",
-    )
-    @classmethod
-    def parse_int(cls, value: str) -> int:
-        return int(value) if value else 0
-
-    # Convert boolean string fields to bool
-    @field_validator("installation_service")
-    @classmethod
-    def parse_bool(cls, value: str) -> bool:
-        return value.lower() == "true"
-
-
-class PingPerfectHeaders(BaseModel):
-    x_client_id: str = Field(..., alias="X-Client-Id")
-    x_signature: str = Field(..., alias="X-Signature")
-    x_timestamp: str = Field(..., alias="X-Timestamp")
-    content_type: str = Field("application/json", alias="Content-Type")
+    voucher_value: int = Field(..., alias="voucherValue")
 
 
 class PingPerfectRequestData(BaseModel):
-    city: str = Field(..., examples=["München"])
-    house_number: str = Field(..., examples=["5"], alias="houseNumber")
-    plz: int = Field(..., examples=[80333])
-    street: str = Field(..., examples=["Musterstraße"])
+    city: City
+    house_number: HouseNumber = Field(..., alias="houseNumber")
+    plz: Zip
+    street: Street
     wants_fiber: bool = Field(False, alias="wantsFiber")
 
 
 class PingPerfectProductInfo(BaseModel):
     speed: int = Field(..., examples=[30])
     contract_duration_in_months: int = Field(..., alias="contractDurationInMonths")
-    connection_type: Literal["DSL", "CABLE", "FIBER", "MOBILE"] = Field(
+    connection_type: PingPerfectConnectionTypeEnum = Field(
         ..., examples=["DSL"], alias="connectionType"
     )
     tv: str = Field(..., examples=["PING TV"])
@@ -232,7 +223,8 @@ class PingPerfectProductInfo(BaseModel):
 
 class PingPerfectPricingDetails(BaseModel):
     monthly_cost_in_cent: int = Field(..., alias="monthlyCostInCent")
-    installation_service: str = Field(..., examples=["no"], alias="installationService")
+    # pydantic-core parses the API's "yes"/"no" strings natively
+    installation_service: bool = Field(..., examples=["no"], alias="installationService")
 
 
 class PingPerfectProduct(BaseModel):
@@ -252,9 +244,8 @@ class VerbynDichRequestData(BaseModel):
         Creates a VerbynDichRequestData instance from an Address object.
         The body will contain the address formatted as required by VerbynDich.
         """
-        # Formatting logic moved here
-        formatted_address = (
-            f"{address.street};{address.house_number};{address.city};{address.zip}"
+        formatted_address = ";".join(
+            (address.street, address.house_number, address.city, str(address.zip))
         )
         return cls(body=formatted_address)
 
@@ -265,8 +256,11 @@ class VerbynDichQueryParams(BaseModel):
 
 
 class VerbynDichProduct(BaseModel):
+    # Parsed descriptions are cached and shared between offers
+    model_config = ConfigDict(frozen=True)
+
     monthly_cost_in_cent: int
-    connection_type: str
+    connection_type: ConnectionTypeEnum
     speed: int
     contract_duration: int
     price_after_promotion: int
@@ -279,18 +273,6 @@ class VerbynDichProduct(BaseModel):
     min_order_value_in_cent: int | None = None
 
 
-class ServusSpeedRequestAddress(BaseModel):
-    street: str = Field(..., examples=["Musterstraße"], alias="strasse")
-    house_number: str = Field(..., examples=["5"], alias="hausnummer")
-    zip: int = Field(..., examples=[80333], alias="postleitzahl")
-    city: str = Field(..., examples=["München"], alias="stadt")
-    country_code: str = Field(..., examples=["DE"], alias="land")
-
-
-class ServusSpeedRequestData(BaseModel):
-    address: ServusSpeedRequestAddress
-
-
 class ServusSpeedHeaders(BaseModel):
     content_type: str = Field("application/json", alias="Content-Type")
     accept: str = Field("*/*", alias="Accept")
@@ -299,13 +281,15 @@ class ServusSpeedHeaders(BaseModel):
 
 
 class ServusSpeedAvailableProducts(BaseModel):
-    available_products: List[str] = Field(..., alias="availableProducts")
+    available_products: List[str] = Field(
+        default_factory=list, alias="availableProducts"
+    )
 
 
 class ServusSpeedProductInfo(BaseModel):
     speed: int = Field(..., examples=[30])
     contract_duration_in_months: int = Field(..., alias="contractDurationInMonths")
-    connection_type: Literal["DSL", "Cable", "Fiber"] = Field(
+    connection_type: ConnectionTypeEnum = Field(
         ..., examples=["DSL"], alias="connectionType"
     )
     tv: str | None = Field(..., examples=["PING TV"])
@@ -325,9 +309,12 @@ class ServusSpeedProduct(BaseModel):
     discount: int = Field(..., description="Discount in cents")
 
 
-class BaseProvider(BaseModel, ABC):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    name: str
+class ServusSpeedProductResponse(BaseModel):
+    servus_speed_product: ServusSpeedProduct = Field(..., alias="servusSpeedProduct")
+
+
+class BaseProvider(ABC):
+    name: ClassVar[str]
 
     @abstractmethod
     async def get_offers(self, request_data: Any) -> List[Dict[str, Any]]:
@@ -338,7 +325,9 @@ class BaseProvider(BaseModel, ABC):
         pass
 
     @abstractmethod
-    def normalize_offer(self, raw_offer: Dict[str, Any]) -> NormalizedOffer:
+    def normalize_offer(
+        self, raw_offer: Dict[str, Any], fetched_at: str | None = None
+    ) -> NormalizedOffer:
         """
         Normalize the provider-specific offer format into a common format.
         """
@@ -0,0 +1,57 @@
+"""
+Row normalization for ByteMe CSV responses.
+
+This module is kept free of pydantic and dynamic features so it can be
+compiled with mypyc (``mypyc app/utils/_fast_parse.py``). A compiled
+extension module takes precedence over this file on import; without it the
+pure Python implementation is used.
+"""
+from typing import Any, Dict, Final, Tuple
+
+
+# (CSV column, ByteMeProduct field) pairs
+_STR_COLUMNS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("productId", "product_id"),
+    ("providerName", "provider_name"),
+    ("connectionType", "connection_type"),
+    ("tv", "tv"),
+    ("voucherType", "voucher_type"),
+)
+
+_INT_COLUMNS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("speed", "speed"),
+    ("monthlyCostInCent", "monthly_cost_in_cent"),
+    ("afterTwoYearsMonthlyCost", "after_two_years_monthly_cost"),
+    ("durationInMonths", "duration_in_months"),
+    ("limitFrom", "limit_from"),
+    ("maxAge", "max_age"),
+    ("voucherValue", "voucher_value"),
+)
+
+
+def parse_int(value: str) -> int:
+    """Convert a CSV cell to int, treating empty cells as 0."""
+    return int(value) if value else 0
+
+
+def normalize_row(row: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Convert a raw ByteMe CSV row into typed ByteMeProduct field values.
+
+    Args:
+        row: A row as produced by csv.DictReader
+
+    Returns:
+        Dictionary keyed by ByteMeProduct field names
+
+    Raises:
+        KeyError: If a required column is missing
+        ValueError: If a numeric column contains a non-integer value
+    """
+    result: Dict[str, Any] = {}
+    for column, field in _STR_COLUMNS:
+        result[field] = row[column]
+    for column, field in _INT_COLUMNS:
+        result[field] = parse_int(row[column])
+    result["installation_service"] = row["installationService"].lower() == "true"
+    return result
@@ -1,31 +1,28 @@
-from typing import Dict
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 
-class ConnectionTypeMapper:
+# Map from API response format to schema enum format (read-only)
+SCHEMA_MAPPING: Mapping[str, str] = MappingProxyType({
+    'DSL': 'DSL',
+    'CABLE': 'Cable',
+    'FIBER': 'Fiber',
+    'MOBILE': 'Mobile'
+})
+
+
+def map_connection_type(
+    api_connection_type: str,
+    _get: Callable[[str, str], str] = SCHEMA_MAPPING.get,
+) -> str:
     """
-    Maps connection types between different formats.
+    Map a provider API connection type to schema format.
+    Unknown values are returned unchanged.
+
+    Args:
+        api_connection_type: Connection type from the provider API
+
+    Returns:
+        Connection type in schema format
     """
-    
-    # Map from API response format to schema enum format
-    SCHEMA_MAPPING: Dict[str, str] = {
-        'DSL': 'DSL',
-        'CABLE': 'Cable', 
-        'FIBER': 'Fiber',
-        'MOBILE': 'Mobile'
-    }
-    
-    @classmethod
-    def map_connection_type(cls, api_connection_type: str) -> str:
-        """
-        Map WebWunder API connection type to schema format.
-        
-        Args:
-            api_connection_type: Connection type from WebWunder API
-            
-        Returns:
-            Connection type in schema format
-        """
-        return cls.SCHEMA_MAPPING.get(
-            api_connection_type, 
-            api_connection_type
-        )
+    return _get(api_connection_type, api_connection_type)
@@ -1,11 +1,11 @@
 """
 Discount calculation utilities for WebWunder offers.
 """
-from math import floor
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class DiscountResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DiscountResult:
     monthly_discount: int | None = None
     monthly_cost_with_discount: int | None = None
     total_savings: int | None = None
@@ -68,8 +68,8 @@ class DiscountCalculator:
         # Default to very high value if max discount not specified
         max_discount = max_discount or 10**10
         
-        # Calculate monthly discount based on percentage
-        monthly_discount_temp = int(base_monthly_cost * (voucher_percentage / 100))
+        # Calculate monthly discount based on percentage (integer cents only)
+        monthly_discount_temp = base_monthly_cost * voucher_percentage // 100
         complete_discount = monthly_discount_temp * self.promotion_length
         
         # Cap the discount by max discount
@@ -77,8 +77,8 @@ class DiscountCalculator:
         
         # Calculate final values
         monthly_discount = absolute_discount // self.promotion_length
-        monthly_cost_with_discount = round(base_monthly_cost - monthly_discount)
-        discount_percentage = floor((monthly_discount / base_monthly_cost) * 100)
+        monthly_cost_with_discount = base_monthly_cost - monthly_discount
+        discount_percentage = monthly_discount * 100 // base_monthly_cost
         
         return DiscountResult(
             monthly_discount=monthly_discount,
@@ -102,9 +102,9 @@ class DiscountCalculator:
         Returns:
             DiscountResult with calculated absolute discount
         """
-        monthly_discount = int(discount_in_cent / self.promotion_length)
+        monthly_discount = discount_in_cent // self.promotion_length
         monthly_cost_with_discount = base_monthly_cost - monthly_discount
-        discount_percentage = floor((monthly_discount / base_monthly_cost) * 100)
+        discount_percentage = monthly_discount * 100 // base_monthly_cost
         
         return DiscountResult(
             monthly_discount=monthly_discount,
@@ -112,12 +112,3 @@ class DiscountCalculator:
             total_savings=discount_in_cent,
             discount_percentage=discount_percentage
         )
-        
-        
-class BytMeDiscountCalculator:
-    """
-    Calculates discounts for ByteMe offers based on voucher types.
-    """
-    
-    def __init__(self, promotion_length: int = 24):
-        self.promotion_length = promotion_length
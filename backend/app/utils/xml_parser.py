@@ -1,132 +1,161 @@
-import xml.etree.ElementTree as ET
-from typing import List, Dict, Any, Optional
+from io import BytesIO
+from lxml import etree
+from typing import Iterator, Dict, Any, Optional
 from app.schemas import WebWunderProduct
+from app.validators import WEBWUNDER_PRODUCT_ADAPTER
+
+
+NAMESPACES = {
+    "SOAP-ENV": "http://schemas.xmlsoap.org/soap/envelope/",
+    "ns2": "http://webwunder.gendev7.check24.fun/offerservice",
+}
+
+
+# Clark notation ("{uri}tag") lets lxml match tags without resolving prefixes
+NS = f"{{{NAMESPACES['ns2']}}}"
+_PRODUCTS_TAG = f"{NS}products"
+_PRODUCT_ID_TAG = f"{NS}productId"
+_PROVIDER_NAME_TAG = f"{NS}providerName"
+_SPEED_TAG = f"{NS}speed"
+_MONTHLY_COST_TAG = f"{NS}monthlyCostInCent"
+_MONTHLY_COST_FROM_25TH_MONTH_TAG = f"{NS}monthlyCostInCentFrom25thMonth"
+_CONTRACT_DURATION_TAG = f"{NS}contractDurationInMonths"
+_CONNECTION_TYPE_TAG = f"{NS}connectionType"
+_PERCENTAGE_TAG = f"{NS}percentage"
+_MAX_DISCOUNT_TAG = f"{NS}maxDiscountInCent"
+_DISCOUNT_TAG = f"{NS}discountInCent"
+_MIN_ORDER_VALUE_TAG = f"{NS}minOrderValueInCent"
 
 
 class WebWunderXMLParser:
     """
     Handles XML parsing for WebWunder SOAP responses.
     """
-    
-    NAMESPACES = {
-        "SOAP-ENV": "http://schemas.xmlsoap.org/soap/envelope/",
-        "ns2": "http://webwunder.gendev7.check24.fun/offerservice",
-    }
+
+    NAMESPACES = NAMESPACES
 
     @classmethod
-    def parse_response(cls, xml_response: str) -> List[WebWunderProduct]:
+    def parse_response(cls, xml_response: str) -> Iterator[WebWunderProduct]:
         """
         Parse WebWunder XML response and extract product information.
-        
+        Products are streamed with iterparse and each product subtree is
+        released once it has been processed, so the element tree does not
+        grow with the number of products.
+
         Args:
             xml_response: Raw XML response from WebWunder API
-            
-        Returns:
-            List of WebWunderProduct objects
+
+        Yields:
+            WebWunderProduct objects
         """
         try:
-            root = ET.fromstring(xml_response)
-            products = root.findall(".//ns2:products", cls.NAMESPACES)
-            
-            product_list = []
-            for product in products:
+            # No entity expansion or network access for untrusted input
+            for _, product in etree.iterparse(
+                BytesIO(xml_response.encode()),
+                tag=_PRODUCTS_TAG,
+                resolve_entities=False,
+                no_network=True,
+            ):
                 product_data = cls._extract_product_data(product)
                 if product_data:
-                    product_list.append(WebWunderProduct(**product_data))
-                    
-            return product_list
-        except ET.ParseError as e:
+                    yield WEBWUNDER_PRODUCT_ADAPTER.validate_python(product_data)
+
+                # Drop the processed product and its preceding siblings
+                product.clear()
+                while product.getprevious() is not None:
+                    del product.getparent()[0]
+        except etree.XMLSyntaxError as e:
             raise ValueError(f"Invalid XML response: {e}")
         except Exception as e:
             raise ValueError(f"Error parsing XML response: {e}")
 
     @classmethod
-    def _extract_product_data(cls, product_element: ET.Element) -> Optional[Dict[str, Any]]:
+    def _extract_product_data(cls, product_element: etree._Element) -> Optional[Dict[str, Any]]:
         """
         Extract product data from a single product XML element.
-        
+
         Args:
             product_element: XML element containing product information
-            
+
         Returns:
             Dictionary with product data or None if extraction fails
         """
         try:
             # Extract voucher information
             voucher_data = cls._extract_voucher_data(product_element)
-            
+
             # Extract basic product information
             product_data = {
-                "product_id": cls._get_text_safe(product_element, "ns2:productId"),
-                "provider_name": cls._get_text_safe(product_element, "ns2:providerName"),
-                "speed": cls._get_int_safe(product_element, ".//ns2:speed"),
-                "monthly_cost_in_cent": cls._get_int_safe(product_element, ".//ns2:monthlyCostInCent"),
+                "product_id": cls._get_text_safe(product_element, _PRODUCT_ID_TAG),
+                "provider_name": cls._get_text_safe(product_element, _PROVIDER_NAME_TAG),
+                "speed": cls._get_int_safe(product_element, _SPEED_TAG),
+                "monthly_cost_in_cent": cls._get_int_safe(product_element, _MONTHLY_COST_TAG),
                 "monthly_cost_in_cent_from_25th_month": cls._get_int_safe(
-                    product_element, ".//ns2:monthlyCostInCentFrom25thMonth"
+                    product_element, _MONTHLY_COST_FROM_25TH_MONTH_TAG
                 ),
                 "contract_duration_in_months": cls._get_int_safe(
-                    product_element, ".//ns2:contractDurationInMonths"
+                    product_element, _CONTRACT_DURATION_TAG
                 ),
-                "connection_type": cls._get_text_safe(product_element, ".//ns2:connectionType"),
+                "connection_type": cls._get_text_safe(product_element, _CONNECTION_TYPE_TAG),
                 **voucher_data
             }
-            
+
             # Validate required fields
             required_fields = ["product_id", "provider_name", "speed", "monthly_cost_in_cent"]
             if any(product_data.get(field) is None for field in required_fields):
                 return None
-                
+
             return product_data
-            
+
         except Exception:
             return None
 
     @classmethod
-    def _extract_voucher_data(cls, product_element: ET.Element) -> Dict[str, Optional[int]]:
+    def _extract_voucher_data(cls, product_element: etree._Element) -> Dict[str, Optional[int]]:
         """
         Extract voucher information from product element.
-        
+
         Args:
             product_element: XML element containing product information
-            
+
         Returns:
             Dictionary with voucher data
         """
         return {
-            "voucher_percentage": cls._get_int_safe(product_element, ".//ns2:percentage"),
-            "max_discount_in_cent": cls._get_int_safe(product_element, ".//ns2:maxDiscountInCent"),
-            "discount_in_cent": cls._get_int_safe(product_element, ".//ns2:discountInCent"),
-            "min_order_value_in_cent": cls._get_int_safe(product_element, ".//ns2:minOrderValueInCent"),
+            "voucher_percentage": cls._get_int_safe(product_element, _PERCENTAGE_TAG),
+            "max_discount_in_cent": cls._get_int_safe(product_element, _MAX_DISCOUNT_TAG),
+            "discount_in_cent": cls._get_int_safe(product_element, _DISCOUNT_TAG),
+            "min_order_value_in_cent": cls._get_int_safe(product_element, _MIN_ORDER_VALUE_TAG),
         }
 
     @classmethod
-    def _get_text_safe(cls, element: ET.Element, xpath: str) -> Optional[str]:
+    def _get_text_safe(cls, element: etree._Element, tag: str) -> Optional[str]:
         """
         Safely extract text from XML element.
-        
+
         Args:
             element: XML element to search in
-            xpath: XPath expression
-            
+            tag: Tag name in Clark notation
+
         Returns:
             Text content or None if not found
         """
-        found_element = element.find(xpath, cls.NAMESPACES)
-        return found_element.text if found_element is not None else None
+        found = next(element.iter(tag), None)
+        return found.text if found is not None else None
 
     @classmethod
-    def _get_int_safe(cls, element: ET.Element, xpath: str) -> Optional[int]:
+    def _get_int_safe(cls, element: etree._Element, tag: str) -> Optional[int]:
         """
         Safely extract integer from XML element.
-        
+
         Args:
             element: XML element to search in
-            xpath: XPath expression
-            
+            tag: Tag name in Clark notation
+
         Returns:
             Integer value or None if not found or invalid
         """
-        text = cls._get_text_safe(element, xpath)
+        text = cls._get_text_safe(element, tag)
         try:
             return int(text) if text is not None else None
         except (ValueError, TypeError):
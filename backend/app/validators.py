@@ -0,0 +1,20 @@
+"""
+Shared TypeAdapters for validating provider responses.
+
+Each adapter is built once at import and reused for every request.
+"""
+from pydantic import TypeAdapter
+
+from app.schemas import (
+    PingPerfectProduct,
+    ServusSpeedAvailableProducts,
+    ServusSpeedProductResponse,
+    VerbynDichProduct,
+    WebWunderProduct,
+)
+
+WEBWUNDER_PRODUCT_ADAPTER = TypeAdapter(WebWunderProduct)
+PING_PERFECT_PRODUCT_LIST_ADAPTER = TypeAdapter(list[PingPerfectProduct])
+VERBYNDICH_PRODUCT_ADAPTER = TypeAdapter(VerbynDichProduct)
+SERVUS_SPEED_AVAILABLE_PRODUCTS_ADAPTER = TypeAdapter(ServusSpeedAvailableProducts)
+SERVUS_SPEED_PRODUCT_RESPONSE_ADAPTER = TypeAdapter(ServusSpeedProductResponse)
@@ -0,0 +1,84 @@
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from app.api.verbynDich import _parse_description
+from app.schemas import ConnectionTypeEnum
+
+
+NOTES = Path(__file__).resolve().parents[1] / "notes.md"
+
+# Sample VerbynDich responses documented in notes.md
+DESCRIPTIONS = [
+    json.loads(f'"{raw}"')
+    for raw in re.findall(r'"description": "([^"]*)"', NOTES.read_text(encoding="utf-8"))
+]
+
+PREMIUM_25 = next(d for d in DESCRIPTIONS if "39€" in d and "25 Mbit/s" in d)
+TV_SENTENCE = "Zusätzlich sind folgende Fernsehsender enthalten RobynTV+. "
+
+WHITESPACE_VARIANTS = {
+    "crlf": PREMIUM_25.replace("\n", "\r\n"),
+    "leading_space": " " + PREMIUM_25,
+    "single_newline": PREMIUM_25.replace("\n\n", "\n"),
+    "tv_after_blank_line": PREMIUM_25.replace(TV_SENTENCE, "").replace(
+        "\n\n", "\n\n" + TV_SENTENCE
+    ),
+}
+
+
+def _reference_parse(description: str) -> dict:
+    """Independent field-by-field regex parse, used as the expected result."""
+
+    def search(pattern: str) -> re.Match | None:
+        return re.search(pattern, description)
+
+    monthly_cost = int(search(r"Für nur (\d+)€ im Monat").group(1)) * 100
+    after = search(r"Ab dem \d+\. Monat beträgt der monatliche Preis (\d+)€")
+    tv = search(r"Fernsehsender enthalten ([^.]+)")
+    data_limit = search(r"Ab (\d+)GB pro Monat wird die Geschwindigkeit gedrosselt")
+    age = search(r"nur für Personen unter (\d+) Jahren")
+    discount = search(r"Rabatt von (\d+)% auf Ihre monatliche Rechnung")
+    max_discount = search(r"Der maximale Rabatt beträgt (\d+)€")
+    absolute = search(r"einmaligen Rabatt von (\d+)€ auf Ihre monatliche Rechnung")
+    min_order = search(r"Der Mindestbestellwert beträgt (\d+)€")
+
+    return {
+        "monthly_cost_in_cent": monthly_cost,
+        "connection_type": ConnectionTypeEnum(
+            search(r"(DSL|Cable|Fiber|Mobile)-Verbindung").group(1)
+        ),
+        "speed": int(search(r"Geschwindigkeit von (\d+) Mbit/s").group(1)),
+        "contract_duration": int(
+            search(r"Mindestvertragslaufzeit (\d+) Monate").group(1)
+        ),
+        "price_after_promotion": int(after.group(1)) * 100 if after else monthly_cost,
+        "tv": tv.group(1).strip() if tv else None,
+        "data_limit": int(data_limit.group(1)) if data_limit else None,
+        "age_restriction": int(age.group(1)) if age else None,
+        "discount_percentage": int(discount.group(1)) if discount else None,
+        "max_discount": int(max_discount.group(1)) * 100 if max_discount else None,
+        "absolute_discount_in_cent": int(absolute.group(1)) * 100 if absolute else None,
+        "min_order_value_in_cent": int(min_order.group(1)) * 100 if min_order else None,
+    }
+
+
+def test_notes_descriptions_found():
+    assert len(DESCRIPTIONS) == 17
+
+
+@pytest.mark.parametrize("description", DESCRIPTIONS)
+def test_parse_notes_descriptions(description):
+    assert _parse_description(description).model_dump() == _reference_parse(description)
+
+
+@pytest.mark.parametrize(
+    "description", WHITESPACE_VARIANTS.values(), ids=WHITESPACE_VARIANTS.keys()
+)
+def test_parse_whitespace_variants(description):
+    parsed = _parse_description(description)
+
+    assert parsed.model_dump() == _reference_parse(description)
+    assert parsed.tv == "RobynTV+"